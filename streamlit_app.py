@@ -1,7 +1,41 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import os
 import re
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+# Optional accelerator: Hyperscan SIMD multi-pattern scanner
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional accelerator: Aho-Corasick automaton for multi-keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional accelerator: RE2 linear-time DFA (google-re2)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Optional accelerator: Numba JIT for the byte-level keyword scanner
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Optional: packed static tries for compact keyword storage
+try:
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
 
 # Set page configuration
 st.set_page_config(
@@ -10,9 +44,20 @@ st.set_page_config(
     layout="wide"
 )
 
+def make_keyword_store(keywords):
+    """Store a keyword collection compactly
+
+    A marisa trie keeps the keywords in one LOUDS-compressed buffer
+    instead of a hash table of boxed strings; iteration, len and
+    membership behave like the plain set fallback.
+    """
+    if marisa_trie is not None:
+        return marisa_trie.Trie(keywords)
+    return set(keywords)
+
 # Initialize session state for dictionaries
 if 'dictionaries' not in st.session_state:
-    st.session_state.dictionaries = {
+    _default_dictionaries = {
         'urgency_marketing': {
             'limited', 'limited time', 'limited run', 'limited edition', 'order now',
             'last chance', 'hurry', 'while supplies last', 'before they\'re gone',
@@ -26,20 +71,426 @@ if 'dictionaries' not in st.session_state:
             'insider', 'private sale', 'early access'
         }
     }
+    st.session_state.dictionaries = {
+        category: make_keyword_store(keywords)
+        for category, keywords in _default_dictionaries.items()
+    }
+
+def _trigram_bits(text):
+    """64-bit Bloom mask of the trigrams occurring in a string"""
+    bits = 0
+    for i in range(len(text) - 2):
+        bits |= 1 << (hash(text[i:i + 3]) & 63)
+    return bits
+
+@st.cache_resource
+def build_category_filters(dict_key):
+    """Per-category trigram Bloom masks for ruling categories out cheaply
+
+    For each category this stores the union of its keywords' trigram
+    masks plus the per-keyword masks. A keyword can only occur in a text
+    whose trigram mask covers the keyword's mask, so one integer AND per
+    category rules most categories out before any substring scan.
+    """
+    filters = {}
+    for category, keywords in dict_key:
+        masks = tuple(_trigram_bits(keyword) for keyword in keywords)
+        if 0 in masks:
+            # A keyword shorter than 3 chars has no trigrams, so the
+            # category can never be ruled out by the filter
+            union = -1
+        else:
+            union = 0
+            for mask in masks:
+                union |= mask
+        filters[category] = (union, masks)
+    return filters
+
+def classify_text(text, dictionaries, dict_key=None):
+    """Classify a single text (row-at-a-time fallback for classify_series)
 
-def classify_text(text, dictionaries):
-    """Classify text based on provided dictionaries"""
+    Per-row callers should pass dict_key=_dict_key(dictionaries) computed
+    once outside the loop; rebuilding the snapshot per call would redo
+    the lowercasing and sorting this function is meant to avoid.
+    """
     text_lower = str(text).lower()
+    if not text_lower:
+        return 'unclassified'
+
+    if dict_key is None:
+        dict_key = _dict_key(dictionaries)
+    filters = build_category_filters(dict_key)
+    text_bits = _trigram_bits(text_lower)
     classifications = []
-    
-    for category, keywords in dictionaries.items():
-        for keyword in keywords:
-            if keyword in text_lower:
+
+    for category, keywords in dict_key:
+        union, masks = filters[category]
+        if union != -1 and not union & text_bits:
+            continue
+        for keyword, mask in zip(keywords, masks):
+            if mask & text_bits == mask and keyword in text_lower:
                 classifications.append(category)
                 break
-    
+
     return ', '.join(classifications) if classifications else 'unclassified'
 
+@st.cache_data
+def sorted_bullets(keywords):
+    """Markdown bullet list of a keyword set, cached so reruns skip the sort"""
+    # A real Markdown list: single newlines are soft breaks and would
+    # collapse the keywords into one paragraph
+    return '\n'.join(f'- {keyword}' for keyword in sorted(keywords))
+
+@st.cache_data
+def load_csv(file_bytes):
+    """Parse uploaded CSV bytes once; reruns reuse the cached DataFrame"""
+    return pd.read_csv(BytesIO(file_bytes), dtype_backend="pyarrow")
+
+@st.cache_data
+def csv_columns(file_bytes):
+    """Column names of the upload; parses only the header row"""
+    return pd.read_csv(BytesIO(file_bytes), nrows=0).columns.tolist()
+
+@st.cache_data
+def load_csv_preview(file_bytes, n_rows=5):
+    """First rows of the upload for the preview table"""
+    return pd.read_csv(BytesIO(file_bytes), nrows=n_rows, dtype_backend="pyarrow")
+
+@st.cache_data
+def load_text_column(file_bytes, column):
+    """Parse only the text column, as pyarrow-backed strings
+
+    Classification reads nothing else, so the other columns are neither
+    parsed nor materialized on the hot path.
+    """
+    texts = pd.read_csv(
+        BytesIO(file_bytes), usecols=[column], dtype_backend="pyarrow"
+    )[column]
+    # Arrow-backed strings so .str.lower/.str.contains dispatch to
+    # pyarrow's C++ kernels
+    return texts.astype(pd.ArrowDtype(pa.string()))
+
+@st.cache_resource
+def build_hyperscan_db(dict_snapshot):
+    """Compile every keyword of every category into one Hyperscan database"""
+    expressions = []
+    ids = []
+    for index, (category, keywords) in enumerate(dict_snapshot):
+        for keyword in keywords:
+            # Keywords are literal substrings, so escape them before
+            # handing them to Hyperscan's regex compiler
+            expressions.append(re.escape(keyword).encode())
+            ids.append(index)
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=expressions,
+        ids=ids,
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions)
+    )
+    return db
+
+@st.cache_resource
+def build_re2_set(dict_snapshot):
+    """Compile one case-insensitive RE2 pattern per non-empty category
+
+    RE2's Set matches all patterns in a single linear-time DFA pass and
+    reports every pattern id that occurred, so no category match can be
+    shadowed by an overlapping match from another category.
+    """
+    pattern_set = re2.Set.SearchSet()
+    for category, keywords in dict_snapshot:
+        if keywords:
+            pattern_set.Add('(?i)' + '|'.join(map(re.escape, keywords)))
+    pattern_set.Compile()
+    return pattern_set
+
+@st.cache_resource
+def build_automaton(dict_snapshot):
+    """Compile a dictionary snapshot into one Aho-Corasick automaton"""
+    # Collect categories per keyword first; a keyword may appear in more
+    # than one category and add_word overwrites the stored value
+    words = {}
+    for category, keywords in dict_snapshot:
+        for keyword in keywords:
+            words.setdefault(keyword, []).append(category)
+
+    automaton = ahocorasick.Automaton()
+    for word, categories in words.items():
+        automaton.add_word(word, tuple(categories))
+    automaton.make_automaton()
+    return automaton
+
+if njit is not None:
+    @njit(parallel=True, nogil=True, cache=True)
+    def _scan_packed(text_bytes, text_offsets, kw_bytes, kw_offsets, kw_lens, kw_cats):
+        """Set one bit per matched category for each row of packed text"""
+        n_rows = text_offsets.shape[0] - 1
+        out = np.zeros(n_rows, dtype=np.uint64)
+        for row in prange(n_rows):
+            start = text_offsets[row]
+            end = text_offsets[row + 1]
+            mask = np.uint64(0)
+            for k in range(kw_offsets.shape[0]):
+                cat_bit = np.uint64(1) << np.uint64(kw_cats[k])
+                if mask & cat_bit:
+                    continue
+                kw_len = kw_lens[k]
+                kw_off = kw_offsets[k]
+                for pos in range(start, end - kw_len + 1):
+                    j = 0
+                    while j < kw_len and text_bytes[pos + j] == kw_bytes[kw_off + j]:
+                        j += 1
+                    if j == kw_len:
+                        mask |= cat_bit
+                        break
+            out[row] = mask
+        return out
+
+@st.cache_resource
+def build_packed_keywords(dict_snapshot):
+    """Flatten all keywords into contiguous arrays for the JITted scanner"""
+    encoded = []
+    offsets = [0]
+    lens = []
+    cats = []
+    for index, (category, keywords) in enumerate(dict_snapshot):
+        for keyword in keywords:
+            raw = keyword.encode('utf-8')
+            encoded.append(raw)
+            offsets.append(offsets[-1] + len(raw))
+            lens.append(len(raw))
+            cats.append(index)
+    kw_bytes = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return (
+        kw_bytes,
+        np.array(offsets[:-1], dtype=np.int64),
+        np.array(lens, dtype=np.int64),
+        np.array(cats, dtype=np.int64),
+    )
+
+# Beyond this many categories the power-set label table gets too large
+# and the matchers fall back to joining labels per row
+MAX_LABEL_TABLE_CATS = 16
+
+@st.cache_resource
+def build_label_table(categories_key):
+    """Precompute the 'cat1, cat2' label for every category bitmask
+
+    One object array indexed by bitmask, so materializing the label
+    column is a single vectorized take instead of a per-row join.
+    """
+    categories = list(categories_key)
+    table = np.empty(1 << len(categories), dtype=object)
+    table[0] = 'unclassified'
+    for mask in range(1, table.shape[0]):
+        table[mask] = ', '.join(
+            category for i, category in enumerate(categories) if mask >> i & 1
+        )
+    return table
+
+def _dict_key(dictionaries):
+    """Hashable snapshot of the dictionaries, used as the matcher cache key
+
+    Category order is preserved because it determines the order of
+    categories in the combined 'cat1, cat2' labels. Keywords are
+    lowercased here, once per snapshot, so the matchers never lowercase
+    them per call.
+    """
+    return tuple(
+        (category, tuple(sorted({keyword.lower() for keyword in keywords})))
+        for category, keywords in dictionaries.items()
+    )
+
+@st.cache_resource
+def build_matcher(dict_key):
+    """Compile the fastest available matcher for a dictionary snapshot
+
+    Returns a function mapping a Series of text to a Series of labels.
+    The compiled artifact lives in Streamlit's resource cache, so
+    repeated classifications against the same dictionaries reuse it;
+    editing a category changes the key and rebuilds it.
+    """
+    categories = [category for category, _ in dict_key]
+    label_table = (
+        build_label_table(tuple(categories))
+        if len(categories) <= MAX_LABEL_TABLE_CATS else None
+    )
+
+    def mask_labels(row_masks):
+        """Decode per-row category bitmasks into label strings"""
+        if label_table is not None:
+            return label_table[np.asarray(row_masks, dtype=np.int64)]
+
+        # Too many categories for a full table: memoize per distinct mask
+        cache = {0: 'unclassified'}
+        out = np.empty(len(row_masks), dtype=object)
+        for row, mask in enumerate(row_masks):
+            mask = int(mask)
+            label = cache.get(mask)
+            if label is None:
+                label = ', '.join(
+                    category
+                    for i, category in enumerate(categories)
+                    if mask >> i & 1
+                )
+                cache[mask] = label
+            out[row] = label
+        return out
+
+    if hyperscan is not None and len(categories) <= 64:
+        # One SIMD-vectorized pass per row over all patterns at once;
+        # matched pattern ids map straight to bits in the row's mask
+        db = build_hyperscan_db(dict_key)
+
+        def matcher(texts):
+            # Iterate the underlying array: plain ndarray iteration skips
+            # pandas' per-element Series machinery
+            values = texts.astype(str).fillna('').to_numpy()
+            row_masks = np.zeros(len(values), dtype=np.uint64)
+            current = 0
+
+            def on_match(pattern_id, start, end, flags, context=None):
+                nonlocal current
+                current |= 1 << pattern_id
+
+            for row, text in enumerate(values):
+                if not text:
+                    continue
+                current = 0
+                # Lowercase before scanning: HS_FLAG_CASELESS only folds
+                # ASCII, and the keywords are stored lowercased
+                db.scan(text.lower().encode('utf-8'), match_event_handler=on_match)
+                row_masks[row] = current
+            return pd.Series(mask_labels(row_masks), index=texts.index)
+
+        return matcher
+
+    if ahocorasick is not None:
+        # One automaton scan per row finds every keyword of every category
+        # in O(len(text)), independent of dictionary size
+        automaton = build_automaton(dict_key)
+        order = {category: i for i, category in enumerate(categories)}
+
+        def matcher(texts):
+            labels = []
+            for text in texts.astype(str).fillna('').to_numpy():
+                if not text:
+                    labels.append('unclassified')
+                    continue
+                found = {
+                    category
+                    for _, matched in automaton.iter(text.lower())
+                    for category in matched
+                }
+                if found:
+                    labels.append(', '.join(sorted(found, key=order.get)))
+                else:
+                    labels.append('unclassified')
+            return pd.Series(labels, index=texts.index)
+
+        return matcher
+
+    if re2 is not None:
+        # One DFA pass per row over all categories at once; Set.Match
+        # returns the ids of every category pattern found in the text
+        pattern_set = build_re2_set(dict_key)
+        set_categories = [category for category, keywords in dict_key if keywords]
+
+        def matcher(texts):
+            labels = []
+            for text in texts.astype(str).fillna('').to_numpy():
+                if not text:
+                    labels.append('unclassified')
+                    continue
+                found = pattern_set.Match(text)
+                if found:
+                    # Match returns ids in match-position order; sort to
+                    # restore dictionary order so labels stay stable
+                    labels.append(', '.join(set_categories[i] for i in sorted(found)))
+                else:
+                    labels.append('unclassified')
+            return pd.Series(labels, index=texts.index)
+
+        return matcher
+
+    if njit is not None and len(categories) <= 64:
+        # Pack the lowercased rows into one byte buffer and let the
+        # JITted scanner set a per-row category bitmask, in parallel and
+        # without the GIL
+        kw_bytes, kw_offsets, kw_lens, kw_cats = build_packed_keywords(dict_key)
+
+        def matcher(texts):
+            encoded = [
+                text.lower().encode('utf-8')
+                for text in texts.astype(str).fillna('').to_numpy()
+            ]
+            text_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(raw) for raw in encoded], out=text_offsets[1:])
+            text_bytes = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+            row_masks = _scan_packed(
+                text_bytes, text_offsets, kw_bytes, kw_offsets, kw_lens, kw_cats
+            )
+            return pd.Series(mask_labels(row_masks), index=texts.index)
+
+        return matcher
+
+    # One escaped alternation regex per category, matched in a single
+    # C-level pass over the Series instead of a Python loop per row
+    patterns = {
+        category: '|'.join(map(re.escape, keywords))
+        for category, keywords in dict_key
+        if keywords
+    }
+    category_bits = {category: i for i, category in enumerate(categories)}
+
+    def matcher(texts):
+        lower = texts.astype(str).str.lower()
+
+        # The per-category scans are independent and the pyarrow-backed
+        # string kernels release the GIL, so fan them out across cores
+        if len(patterns) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(patterns), os.cpu_count() or 1)
+            ) as executor:
+                masks = dict(zip(patterns, executor.map(
+                    lambda pattern: lower.str.contains(pattern, regex=True, na=False),
+                    patterns.values()
+                )))
+        else:
+            masks = {
+                category: lower.str.contains(pattern, regex=True, na=False)
+                for category, pattern in patterns.items()
+            }
+
+        if len(categories) <= 64:
+            # OR each category's boolean column into a per-row bitmask,
+            # then materialize every label with one vectorized take
+            row_masks = np.zeros(len(lower), dtype=np.uint64)
+            for category, column in masks.items():
+                row_masks |= (
+                    column.to_numpy().astype(np.uint64)
+                    << np.uint64(category_bits[category])
+                )
+            return pd.Series(mask_labels(row_masks), index=texts.index)
+
+        # Too many categories for a 64-bit mask: combine the boolean
+        # columns into 'cat1, cat2' labels with a dot product
+        mask_frame = pd.DataFrame(masks)
+        labels = mask_frame.dot(np.array(list(masks), dtype=object) + ', ')
+        labels = labels.str.rstrip(', ')
+        return labels.replace('', 'unclassified')
+
+    return matcher
+
+def classify_series(texts, dictionaries):
+    """Classify a whole Series of text with the compiled matcher"""
+    if not any(dictionaries.values()):
+        return pd.Series('unclassified', index=texts.index)
+
+    matcher = build_matcher(_dict_key(dictionaries))
+    return matcher(texts)
+
 def main():
     st.title("📊 Text Classification Tool")
     st.markdown("Upload your dataset and classify text using customizable keyword dictionaries.")
@@ -49,48 +500,51 @@ def main():
     
     # Dictionary modification section
     st.sidebar.subheader("Current Categories")
-    
-    # Display and allow editing of existing dictionaries
-    for category in list(st.session_state.dictionaries.keys()):
-        with st.sidebar.expander(f"📝 {category}"):
-            # Display current keywords
-            current_keywords = list(st.session_state.dictionaries[category])
-            keywords_text = '\n'.join(current_keywords)
-            
-            # Text area for editing keywords
-            new_keywords = st.text_area(
-                f"Keywords for {category}:",
-                value=keywords_text,
-                height=100,
-                key=f"keywords_{category}"
-            )
-            
-            # Update button
-            if st.button(f"Update {category}", key=f"update_{category}"):
-                # Parse the new keywords
-                updated_keywords = set([kw.strip() for kw in new_keywords.split('\n') if kw.strip()])
-                st.session_state.dictionaries[category] = updated_keywords
-                st.success(f"Updated {category}!")
-            
-            # Delete category button
-            if st.button(f"Delete {category}", key=f"delete_{category}"):
-                del st.session_state.dictionaries[category]
-                st.success(f"Deleted {category}!")
-                st.rerun()
-    
-    # Add new category section
-    st.sidebar.subheader("➕ Add New Category")
-    new_category_name = st.sidebar.text_input("Category Name:")
-    new_category_keywords = st.sidebar.text_area("Keywords (one per line):", height=80)
-    
-    if st.sidebar.button("Add Category"):
-        if new_category_name and new_category_keywords:
-            keywords_set = set([kw.strip() for kw in new_category_keywords.split('\n') if kw.strip()])
-            st.session_state.dictionaries[new_category_name] = keywords_set
-            st.sidebar.success(f"Added category: {new_category_name}")
-            st.rerun()
-        else:
-            st.sidebar.error("Please provide both category name and keywords.")
+
+    # One table editor for all categories: a single widget payload per
+    # rerun instead of an expander, text area and two buttons per category
+    categories = list(st.session_state.dictionaries.keys())
+    editor_df = pd.DataFrame({
+        'category': categories,
+        'keywords': [
+            ', '.join(sorted(st.session_state.dictionaries[category]))
+            for category in categories
+        ],
+    })
+    edited = st.sidebar.data_editor(
+        editor_df,
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        key="dict_editor"
+    )
+    st.sidebar.caption(
+        "One row per category; keywords are comma-separated. "
+        "Add or delete rows to add or delete categories."
+    )
+
+    if st.sidebar.button("Apply Changes"):
+        new_dictionaries = {}
+        for row in edited.itertuples(index=False):
+            name = '' if pd.isna(row.category) else str(row.category).strip()
+            if not name:
+                continue
+            keywords_text = '' if pd.isna(row.keywords) else str(row.keywords)
+            # Matching is case-insensitive, so normalize to lowercase here
+            # rather than per classify call
+            keywords = set([kw.strip().lower() for kw in keywords_text.split(',') if kw.strip()])
+
+            # Only rebuild stores for rows that actually changed
+            old_store = st.session_state.dictionaries.get(name)
+            if old_store is not None and set(old_store) == keywords:
+                new_dictionaries[name] = old_store
+            else:
+                new_dictionaries[name] = make_keyword_store(keywords)
+
+        # No rerun: the dictionaries are updated before the rest of this
+        # pass renders, and a rerun would discard the confirmation
+        st.session_state.dictionaries = new_dictionaries
+        st.sidebar.success("Dictionaries updated!")
     
     # Main content area
     col1, col2 = st.columns([2, 1])
@@ -107,55 +561,68 @@ def main():
         
         if uploaded_file is not None:
             try:
-                # Read the CSV file
-                df = pd.read_csv(uploaded_file)
-                
-                st.success(f"File uploaded successfully! Shape: {df.shape}")
-                
+                # Only the header is parsed up front; the full file is
+                # parsed when the user actually classifies. All reads are
+                # cached on the file bytes, so widget interactions never
+                # re-parse the upload
+                file_bytes = uploaded_file.getvalue()
+                columns = csv_columns(file_bytes)
+
+                st.success(f"File uploaded successfully! {len(columns)} columns detected.")
+
                 # Column selection
                 text_column = st.selectbox(
                     "Select the column containing text to classify:",
-                    options=df.columns.tolist(),
+                    options=columns,
                     help="Choose which column contains the text you want to classify"
                 )
-                
+
                 # Preview data
                 st.subheader("📋 Data Preview")
-                st.dataframe(df.head(), use_container_width=True)
+                st.dataframe(load_csv_preview(file_bytes), use_container_width=True)
                 
                 # Classification button
                 if st.button("🚀 Classify Text", type="primary"):
                     if not st.session_state.dictionaries:
                         st.error("Please add at least one category with keywords before classifying.")
                     else:
-                        # Apply classification
+                        # Apply classification; only the text column is
+                        # parsed and handed to the matcher
                         with st.spinner("Classifying text..."):
-                            df['classification'] = df[text_column].apply(
-                                lambda x: classify_text(x, st.session_state.dictionaries)
-                            )
+                            texts = load_text_column(file_bytes, text_column)
+                            # Few distinct labels over many rows: categorical
+                            # stores small int codes plus one copy of each label
+                            results = pd.DataFrame({
+                                text_column: texts,
+                                'classification': classify_series(
+                                    texts, st.session_state.dictionaries
+                                ).astype('category'),
+                            })
                         
                         st.success("Classification completed!")
                         
                         # Display results
                         st.subheader("📊 Classification Results")
                         
-                        # Summary statistics
+                        # Summary statistics: one scan of the column covers
+                        # both counts, no filtered copies just to call len
+                        unclassified_count = int((results['classification'] == 'unclassified').sum())
+                        classified_count = len(results) - unclassified_count
+
                         col_stats1, col_stats2, col_stats3 = st.columns(3)
-                        
+
                         with col_stats1:
-                            st.metric("Total Statements", len(df))
-                        
+                            st.metric("Total Statements", len(results))
+
                         with col_stats2:
-                            classified_count = len(df[df['classification'] != 'unclassified'])
                             st.metric("Classified", classified_count)
-                        
+
                         with col_stats3:
-                            unclassified_count = len(df[df['classification'] == 'unclassified'])
                             st.metric("Unclassified", unclassified_count)
                         
                         # Classification distribution
                         st.subheader("📈 Classification Distribution")
-                        classification_counts = df['classification'].value_counts()
+                        classification_counts = results['classification'].value_counts()
                         st.bar_chart(classification_counts)
                         
                         # Detailed results table
@@ -170,13 +637,22 @@ def main():
                         
                         # Apply filter
                         if filter_option == 'All':
-                            filtered_df = df
+                            filtered_df = results
                         elif filter_option == 'Classified Only':
-                            filtered_df = df[df['classification'] != 'unclassified']
+                            filtered_df = results[results['classification'] != 'unclassified']
                         elif filter_option == 'Unclassified Only':
-                            filtered_df = df[df['classification'] == 'unclassified']
+                            filtered_df = results[results['classification'] == 'unclassified']
                         else:
-                            filtered_df = df[df['classification'].str.contains(filter_option, na=False)]
+                            # Exact membership on the small set of distinct
+                            # labels, then one vectorized isin over the codes;
+                            # a substring scan would also hit categories whose
+                            # names contain the selected one
+                            selected_labels = {
+                                label
+                                for label in results['classification'].cat.categories
+                                if filter_option in label.split(', ')
+                            }
+                            filtered_df = results[results['classification'].isin(selected_labels)]
                         
                         st.dataframe(
                             filtered_df[[text_column, 'classification']], 
@@ -184,11 +660,14 @@ def main():
                             height=400
                         )
                         
-                        # Download classified data
-                        csv_buffer = StringIO()
-                        df.to_csv(csv_buffer, index=False)
-                        csv_data = csv_buffer.getvalue()
-                        
+                        # Download classified data: only here is the full
+                        # file parsed, to join the remaining columns back in.
+                        # to_csv returns the string directly, no intermediate
+                        # StringIO copy
+                        df = load_csv(file_bytes)
+                        df['classification'] = results['classification']
+                        csv_data = df.to_csv(index=False)
+
                         st.download_button(
                             label="📥 Download Classified Data",
                             data=csv_data,
@@ -207,8 +686,9 @@ def main():
         if st.session_state.dictionaries:
             for category, keywords in st.session_state.dictionaries.items():
                 with st.expander(f"📂 {category} ({len(keywords)} keywords)"):
-                    for keyword in sorted(keywords):
-                        st.write(f"• {keyword}")
+                    # One cached markdown render instead of a sort plus one
+                    # st.write per keyword on every rerun
+                    st.markdown(sorted_bullets(frozenset(keywords)))
         else:
             st.info("No categories defined. Add some categories using the sidebar.")
         
@@ -219,17 +699,18 @@ def main():
         
         1. **Upload Data**: Upload a CSV file with text to classify
         2. **Select Column**: Choose which column contains the text
-        3. **Modify Dictionaries**: Use the sidebar to:
-           - Edit existing categories
-           - Add new categories
-           - Delete unwanted categories
+        3. **Modify Dictionaries**: Use the sidebar table to:
+           - Edit a category's keywords
+           - Add new categories (add a row)
+           - Delete unwanted categories (delete the row)
+           then click *Apply Changes*
         4. **Classify**: Click the classify button to process your data
         5. **Review Results**: Examine the classification results and download
-        
+
         **Dictionary Format:**
         - Each category contains keywords/phrases
         - Keywords are case-insensitive
-        - Put each keyword on a new line
+        - Separate keywords with commas
         - Text is classified if it contains any keyword from a category
         """)
 